@@ -13,19 +13,34 @@ Key Features:
 - Comprehensive debug statements and robust exception handling.
 """
 
+import functools
 import logging
 import os
 import sqlite3
 import json
 from typing import Dict, Any, Optional, List, Callable, Union
 
+try:
+    import apsw  # Optional: faster bindings for the database setup path
+except ImportError:
+    apsw = None
+
+try:
+    import orjson  # Optional: faster serialisation of the per-turn finalisation payloads
+
+    def _dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:  # e.g. integers wider than 64 bits, which json handles
+            return json.dumps(obj)
+except ImportError:
+    from json import dumps as _dumps
+
 from swarm import Agent, Swarm
-from swarm.repl import run_demo_loop
 from swarm.extensions.blueprint import BlueprintBase
 
-# Configure logging with detailed debug statements
+# Configure logging; the level is inherited from the application's logging configuration
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # Set to DEBUG to capture all levels of logs
 stream_handler = logging.StreamHandler()
 formatter = logging.Formatter("[%(asctime)s] [%(levelname)s] %(message)s")
 stream_handler.setFormatter(formatter)
@@ -38,6 +53,115 @@ AgentFunction = Callable[..., Union[Agent, str]]
 SCHEDULER_TABLE = "schedules"
 COURSE_ADVISOR_TABLE = "courses"
 
+# PRAGMAs applied when the connection is opened so the seed is not fsynced per statement
+SQLITE_SETUP_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+
+# Schema for the university tables, created in one script alongside the seed transaction
+SCHEMA_SQL = f"""
+CREATE TABLE IF NOT EXISTS {COURSE_ADVISOR_TABLE} (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    course_name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    discipline TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS {SCHEDULER_TABLE} (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    course_name TEXT NOT NULL,
+    class_time TEXT NOT NULL,
+    exam_date TEXT NOT NULL
+);
+"""
+
+# Parameterised inserts for the sample data, keyed by table name
+SAMPLE_DATA_INSERTS = {
+    COURSE_ADVISOR_TABLE: f"INSERT INTO {COURSE_ADVISOR_TABLE} (course_name, description, discipline) VALUES (?, ?, ?)",
+    SCHEDULER_TABLE: f"INSERT INTO {SCHEDULER_TABLE} (course_name, class_time, exam_date) VALUES (?, ?, ?)",
+}
+SAMPLE_DATA_BATCH_SIZE = 50
+SAMPLE_DATA_PATH = os.path.join(os.path.dirname(__file__), "sample_data.json")
+
+# Closing message returned by every finalisation tool call, and the marker execute() looks for
+_FINAL_MARKER = "Thank you for using the University Support System"
+_THANKS = f"{_FINAL_MARKER}. If you have more questions, feel free to reach out!"
+
+# Haiku returned by the University Poet when 'response_haiku' is set
+_HAIKU = "A student asks why,\nCampus calls with ancient tales,\nWisdom finds its way.\n"
+
+# Fallback instructions for each agent, used when no instructions_<Agent>.txt file is found
+_HARDCODED_INSTRUCTIONS = {
+    "TriageAgent": (
+        "You are the Triage Agent, responsible for analysing user queries and directing them to the appropriate specialised agent. "
+        "Evaluate the content and intent of each query to determine whether it pertains to course recommendations, campus culture, or scheduling assistance. "
+        "Provide a brief reasoning before making the handoff to ensure transparency in your decision-making process. "
+        "If a handoff is required, use the appropriate tool call for the target agent, such as `triage_to_course_advisor`, `triage_to_university_poet`, or `triage_to_scheduling_assistant`."
+        "If the user says they want a haiku, you should set the 'response_haiku' variable to 'true'"
+    ),
+    "CourseAdvisor": (
+        "You are the Course Advisor, dedicated to providing personalised course recommendations based on the user's academic interests and goals. "
+        "Engage the user with insightful questions to understand their preferences, such as preferred disciplines, desired career paths, and previous coursework. "
+        "Offer detailed explanations for each recommended course, highlighting how they align with the user's objectives. "
+        "You have access to a tool named `read_query` which can be used to query data from an sqlite database, to better inform your advice, especially on what courses are available."
+    ),
+    "UniversityPoet": (
+        "You are the University Poet, tasked with responding to queries about campus culture, events, and social activities in the form of creative haikus. "
+        "Embrace a poetic and imaginative approach to provide concise and aesthetically pleasing responses that capture the essence of the university's vibrant community."
+    ),
+    "SchedulingAssistant": (
+        "You are the Scheduling Assistant, responsible for managing and providing information about class schedules, exam dates, and important academic timelines. "
+        "Interact with the user to ascertain their specific scheduling needs, such as course timings, exam schedules, and deadline dates. "
+        "Offer clear, concise, and factual information to help users effectively plan their academic activities. "
+        "You have access to a tool named `read_query` which can be used to query data from an sqlite database, to better inform your advice, especially on class schedules."
+    )
+}
+
+# Instruction filename per agent (spaces in names become underscores), built once at import
+_AGENT_FILENAMES = {name: f"instructions_{name.replace(' ', '_')}.txt" for name in _HARDCODED_INSTRUCTIONS}
+
+
+@functools.lru_cache(maxsize=64)
+def _read_instructions(path: str, mtime: float) -> str:
+    """
+    Read an instructions file, cached on (path, mtime) so edits invalidate the cache.
+    """
+    with open(path, 'r') as file:
+        return file.read()
+
+
+def _load_sample_data() -> Dict[str, List[List[Any]]]:
+    """
+    Load the sample rows for each table from sample_data.json.
+    Returns an empty dict if the file does not exist.
+    """
+    if not os.path.isfile(SAMPLE_DATA_PATH):
+        logger.warning("Sample data file %s does not exist. Skipping data population.", SAMPLE_DATA_PATH)
+        return {}
+    try:
+        logger.debug("Loading sample data from %s.", SAMPLE_DATA_PATH)
+        with open(SAMPLE_DATA_PATH, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.exception("Failed to load sample data from %s: %s", SAMPLE_DATA_PATH, e)
+        raise e
+
+
+def _insert_sample_data(cursor: Any, sample_data: Dict[str, List[List[Any]]]) -> None:
+    """
+    Insert sample rows in batches of SAMPLE_DATA_BATCH_SIZE.
+    Works with both sqlite3 and apsw cursors, inside the caller's transaction.
+    """
+    for table, insert_sql in SAMPLE_DATA_INSERTS.items():
+        rows = sample_data.get(table, [])
+        for i in range(0, len(rows), SAMPLE_DATA_BATCH_SIZE):
+            cursor.executemany(insert_sql, rows[i:i + SAMPLE_DATA_BATCH_SIZE])
+        logger.debug("Inserted %s rows into %s.", len(rows), table)
+    if sample_data:
+        logger.info("Sample data populated successfully.")
+
 
 class UniversitySupportBlueprint(BlueprintBase):
     """
@@ -57,6 +181,8 @@ class UniversitySupportBlueprint(BlueprintBase):
 
         logger.debug("Swarm client initialized.")
         self.client = Swarm()
+        self._db_ready: bool = False  # Set once the SQLite database is known to be provisioned
+        self._sqlite_db_path: Optional[str] = None  # Resolved by validate_env_vars()
         logger.info("University Support Blueprint initialized successfully.")
 
     @property
@@ -75,15 +201,67 @@ class UniversitySupportBlueprint(BlueprintBase):
         if not sqlite_db_path:
             logger.error("Environment variable SQLITE_DB_PATH is not set.")
             raise EnvironmentError("SQLITE_DB_PATH environment variable is required.")
+        self._sqlite_db_path = sqlite_db_path
 
-        logger.debug(f"SQLITE_DB_PATH found: {sqlite_db_path}")
+        logger.debug("SQLITE_DB_PATH found: %s", sqlite_db_path)
+
+    def _setup_database_sqlite3(self, sqlite_db_path: str) -> None:
+        """
+        Creates and seeds the database through the stdlib sqlite3 module. The connection
+        is only needed for this one-off setup, so it is closed before returning.
+        """
+        logger.debug("Connecting to SQLite database at %s.", sqlite_db_path)
+        conn = sqlite3.connect(sqlite_db_path)
+        try:
+            for pragma in SQLITE_SETUP_PRAGMAS:
+                conn.execute(pragma)
+            cursor = conn.cursor()
+            # Open the setup transaction and create both tables in a single script
+            logger.debug("Creating tables %s and %s.", COURSE_ADVISOR_TABLE, SCHEDULER_TABLE)
+            cursor.executescript(f"BEGIN;\n{SCHEMA_SQL}")
+            logger.info("Tables %s and %s created successfully.", COURSE_ADVISOR_TABLE, SCHEDULER_TABLE)
+
+            # Populate tables with sample data rows from separate JSON file
+            _insert_sample_data(cursor, _load_sample_data())
+
+            conn.commit()
+            logger.debug("Committing changes to the database.")
+        except Exception:
+            conn.rollback()  # Don't leave a half-applied schema behind
+            raise
+        finally:
+            conn.close()
+
+    def _setup_database_apsw(self, sqlite_db_path: str) -> None:
+        """
+        Creates and seeds the database through apsw, which executes scripts directly via
+        sqlite3_exec without the stdlib module's implicit transaction handling.
+        """
+        logger.debug("Setting up SQLite database at %s with apsw.", sqlite_db_path)
+        sample_data = _load_sample_data()
+        conn = apsw.Connection(sqlite_db_path)
+        try:
+            cursor = conn.cursor()
+            for pragma in SQLITE_SETUP_PRAGMAS:
+                cursor.execute(pragma).fetchall()
+            with conn:  # Single transaction for schema and seed; rolled back on error
+                cursor.execute(SCHEMA_SQL)
+                logger.info("Tables %s and %s created successfully.", COURSE_ADVISOR_TABLE, SCHEDULER_TABLE)
+                _insert_sample_data(cursor, sample_data)
+        finally:
+            conn.close()
 
     def _ensure_database_setup(self) -> None:
         """
         Ensures the SQLite database exists and is populated with required data.
+        The outcome is memoised, so later calls return without touching the filesystem.
         """
+        if self._db_ready:
+            return
         logger.debug("Ensuring database setup.")
-        sqlite_db_path = os.getenv("SQLITE_DB_PATH")
+        if self._sqlite_db_path is None:
+            self.validate_env_vars()  # interactive_mode() reaches here without execute()'s validation
+        sqlite_db_path = self._sqlite_db_path
         db_exists = os.path.isfile(sqlite_db_path)
 
         if not db_exists:
@@ -91,71 +269,30 @@ class UniversitySupportBlueprint(BlueprintBase):
            db_dir = os.path.dirname(sqlite_db_path)
            if db_dir and not os.path.isdir(db_dir):
                try:
-                   logger.debug(f"Database directory {db_dir} does not exist. Creating directory.")
+                   logger.debug("Database directory %s does not exist. Creating directory.", db_dir)
                    os.makedirs(db_dir, exist_ok=True)
-                   logger.info(f"Database directory {db_dir} created successfully.")
+                   logger.info("Database directory %s created successfully.", db_dir)
                except Exception as e:
-                   logger.exception(f"Failed to create database directory {db_dir}: {e}")
+                   logger.exception("Failed to create database directory %s: %s", db_dir, e)
                    raise e
            else:
-               logger.debug(f"Database directory {db_dir} already exists.")
+               logger.debug("Database directory %s already exists.", db_dir)
 
            try:
-                logger.debug(f"Connecting to SQLite database at {sqlite_db_path}.")
-                conn = sqlite3.connect(sqlite_db_path)
-                cursor = conn.cursor()
-
-                # Create courses table
-                logger.debug(f"Creating table {COURSE_ADVISOR_TABLE}.")
-                cursor.execute(f"""
-                    CREATE TABLE IF NOT EXISTS {COURSE_ADVISOR_TABLE} (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        course_name TEXT NOT NULL,
-                        description TEXT NOT NULL,
-                        discipline TEXT NOT NULL
-                    );
-                """)
-                logger.info(f"Table {COURSE_ADVISOR_TABLE} created successfully.")
-
-                # Create schedules table
-                logger.debug(f"Creating table {SCHEDULER_TABLE}.")
-                cursor.execute(f"""
-                    CREATE TABLE IF NOT EXISTS {SCHEDULER_TABLE} (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        course_name TEXT NOT NULL,
-                        class_time TEXT NOT NULL,
-                        exam_date TEXT NOT NULL
-                    );
-                """)
-                logger.info(f"Table {SCHEDULER_TABLE} created successfully.")
-
-                # Populate tables with sample data from separate SQL file
-                sample_data_path = os.path.join(os.path.dirname(__file__), "sample_data.sql")
-                if os.path.isfile(sample_data_path):
-                    try:
-                        logger.debug(f"Loading sample data from {sample_data_path}.")
-                        with open(sample_data_path, 'r') as f:
-                            sample_data = f.read()
-                            cursor.executescript(sample_data)
-                        logger.info("Sample data populated successfully.")
-                    except Exception as e:
-                        logger.exception(f"Failed to load sample data from {sample_data_path}: {e}")
-                        raise e
+                if apsw is not None:
+                    self._setup_database_apsw(sqlite_db_path)
                 else:
-                   logger.warning(f"Sample data file {sample_data_path} does not exist. Skipping data population.")
-
-
-                conn.commit()
-                logger.debug("Committing changes to the database.")
-                conn.close()
+                    self._setup_database_sqlite3(sqlite_db_path)
+                self._db_ready = True
                 logger.info("SQLite database setup completed successfully.")
            except sqlite3.Error as db_err:
-               logger.exception(f"SQLite error during database setup: {db_err}")
+               logger.exception("SQLite error during database setup: %s", db_err)
                raise db_err
            except Exception as e:
-               logger.exception(f"Unexpected error during database setup: {e}")
+               logger.exception("Unexpected error during database setup: %s", e)
                raise e
         else:
+             self._db_ready = True
              logger.debug("SQLite database already exists. Skipping database setup.")
 
 
@@ -167,65 +304,37 @@ class UniversitySupportBlueprint(BlueprintBase):
 
         # Directory where the blueprint is located
         blueprint_dir = os.path.dirname(__file__)
-        logger.debug(f"Blueprint directory: {blueprint_dir}")
+        logger.debug("Blueprint directory: %s", blueprint_dir)
 
         # Helper function to load instructions from a file
-        def load_instructions(agent_name: str) -> str:
+        def load_instructions(agent_name: str, instruction_path: str) -> str:
             """
-            Attempts to load agent instructions from an external .txt file.
+            Attempts to load agent instructions from the given external .txt file.
             If the file does not exist or is unreadable, returns an empty string.
             """
-            # Replace spaces with underscores for the filename
-            agent_filename_part = agent_name.replace(" ", "_")
-            instruction_filename = f"instructions_{agent_filename_part}.txt"
-            instruction_path = os.path.join(blueprint_dir, instruction_filename)
-            if os.path.isfile(instruction_path):
-                try:
-                    logger.debug(f"Loading instructions for {agent_name} from {instruction_filename}.")
-                    with open(instruction_path, 'r') as file:
-                        instructions = file.read()
-                        logger.info(f"Instructions for {agent_name} loaded successfully from {instruction_filename}.")
-                        return instructions
-                except Exception as e:
-                    logger.exception(f"Error reading {instruction_filename}: {e}")
-            else:
-                logger.warning(f"Instruction file {instruction_filename} not found for {agent_name}. Using hardcoded instructions.")
+            instruction_filename = os.path.basename(instruction_path)
+            try:
+                logger.debug("Loading instructions for %s from %s.", agent_name, instruction_filename)
+                # getmtime doubles as the existence check, so the happy path is a single stat
+                instructions = _read_instructions(instruction_path, os.path.getmtime(instruction_path))
+                logger.info("Instructions for %s loaded successfully from %s.", agent_name, instruction_filename)
+                return instructions
+            except FileNotFoundError:
+                logger.warning("Instruction file %s not found for %s. Using hardcoded instructions.", instruction_filename, agent_name)
+            except Exception as e:
+                logger.exception("Error reading %s: %s", instruction_filename, e)
             return ""
 
-        # Define hardcoded instructions for each agent
-        hardcoded_instructions = {
-            "TriageAgent": (
-                "You are the Triage Agent, responsible for analysing user queries and directing them to the appropriate specialised agent. "
-                "Evaluate the content and intent of each query to determine whether it pertains to course recommendations, campus culture, or scheduling assistance. "
-                "Provide a brief reasoning before making the handoff to ensure transparency in your decision-making process. "
-                "If a handoff is required, use the appropriate tool call for the target agent, such as `triage_to_course_advisor`, `triage_to_university_poet`, or `triage_to_scheduling_assistant`."
-                "If the user says they want a haiku, you should set the 'response_haiku' variable to 'true'"
-            ),
-            "CourseAdvisor": (
-                "You are the Course Advisor, dedicated to providing personalised course recommendations based on the user's academic interests and goals. "
-                "Engage the user with insightful questions to understand their preferences, such as preferred disciplines, desired career paths, and previous coursework. "
-                "Offer detailed explanations for each recommended course, highlighting how they align with the user's objectives. "
-                "You have access to a tool named `read_query` which can be used to query data from an sqlite database, to better inform your advice, especially on what courses are available."
-            ),
-            "UniversityPoet": (
-                "You are the University Poet, tasked with responding to queries about campus culture, events, and social activities in the form of creative haikus. "
-                "Embrace a poetic and imaginative approach to provide concise and aesthetically pleasing responses that capture the essence of the university's vibrant community."
-            ),
-            "SchedulingAssistant": (
-                "You are the Scheduling Assistant, responsible for managing and providing information about class schedules, exam dates, and important academic timelines. "
-                "Interact with the user to ascertain their specific scheduling needs, such as course timings, exam schedules, and deadline dates. "
-                "Offer clear, concise, and factual information to help users effectively plan their academic activities. "
-                "You have access to a tool named `read_query` which can be used to query data from an sqlite database, to better inform your advice, especially on class schedules."
-            )
-        }
+        # Resolve each agent's instruction file once
+        instruction_paths = {name: os.path.join(blueprint_dir, filename) for name, filename in _AGENT_FILENAMES.items()}
 
         # Create each agent and register with swarm
         agents = {}
-        for agent_name, default_instructions in hardcoded_instructions.items():
-            instructions = load_instructions(agent_name)
+        for agent_name, default_instructions in _HARDCODED_INSTRUCTIONS.items():
+            instructions = load_instructions(agent_name, instruction_paths[agent_name])
             if not instructions:
                 instructions = default_instructions
-                logger.debug(f"Using hardcoded instructions for {agent_name}.")
+                logger.debug("Using hardcoded instructions for %s.", agent_name)
 
             # Define functions for each agent using self. methods (these functions use a context_variables dictionary):
             if agent_name == "TriageAgent":
@@ -257,6 +366,11 @@ class UniversitySupportBlueprint(BlueprintBase):
                 logger.info(f"Agent {agent_name} created successfully.")
             except Exception as e:
                 logger.exception(f"Failed to create agent {agent_name}: {e}")
+
+        # Cache handoff targets so the triage tool calls avoid a registry lookup per call
+        self._course_advisor = agents.get("CourseAdvisor")
+        self._university_poet = agents.get("UniversityPoet")
+        self._scheduling_assistant = agents.get("SchedulingAssistant")
         logger.info("All University Support agents created.")
 
 
@@ -265,17 +379,6 @@ class UniversitySupportBlueprint(BlueprintBase):
         logger.debug("Retrieving agents.")
         return self.swarm.agents  # Retrieve agents from swarm
 
-    # =========================================
-    # 1) Finalisation Functions
-    # =========================================
-
-    def _finalise_response(self, context_variables: dict) -> str:
-        """
-        Finalises the interaction with the user.
-        """
-        logger.debug("Finalising user interaction.")
-        return json.dumps({"content":"Thank you for using the University Support System. If you have more questions, feel free to reach out!", "context_variables": context_variables})
-
     # =========================================
     # 2) Handoff Functions (as tool calls)
     # =========================================
@@ -286,21 +389,21 @@ class UniversitySupportBlueprint(BlueprintBase):
         Handoff to Course Advisor.
         """
         logger.debug("Handing off to Course Advisor.")
-        return self.swarm.agents.get("CourseAdvisor")
+        return self._course_advisor
 
     def _triage_to_university_poet(self, context_variables: dict) -> Agent:
         """
         Handoff to University Poet.
         """
         logger.debug("Handing off to University Poet.")
-        return self.swarm.agents.get("UniversityPoet")
+        return self._university_poet
 
     def _triage_to_scheduling_assistant(self, context_variables: dict) -> Agent:
         """
         Handoff to Scheduling Assistant.
         """
         logger.debug("Handing off to Scheduling Assistant.")
-        return self.swarm.agents.get("SchedulingAssistant")
+        return self._scheduling_assistant
 
     # CourseAdvisor handoff (finalisation) (now tool calls)
     def _course_advisor_finalise(self, context_variables: dict) -> str:
@@ -308,7 +411,7 @@ class UniversitySupportBlueprint(BlueprintBase):
         Finalise interaction from Course Advisor.
         """
         logger.debug("Course Advisor finalising interaction.")
-        return json.dumps({"content": self._finalise_response(context_variables), "context_variables": context_variables})
+        return _dumps({"content": _THANKS, "context_variables": context_variables})
 
     # UniversityPoet handoff (finalisation) (now tool calls)
     def _university_poet_finalise(self, context_variables: dict) -> str:
@@ -317,18 +420,11 @@ class UniversitySupportBlueprint(BlueprintBase):
         """
         logger.debug("University Poet finalising interaction.")
         if context_variables.get('response_haiku') == 'true':
-            logger.info(f"UniversityPoet will respond with a haiku. Context: {context_variables}")
-            return json.dumps({"content": f"{self._university_poet_haiku()}", "context_variables": context_variables})
+            logger.info("UniversityPoet will respond with a haiku. Context: %s", context_variables)
+            return _dumps({"content": _HAIKU, "context_variables": context_variables})
         else:
-            logger.info(f"UniversityPoet will respond with a normal response. Context: {context_variables}")
-            return json.dumps({"content": self._finalise_response(context_variables) , "context_variables": context_variables})
-
-    def _university_poet_haiku(self) -> str:
-        return f"""
-            A student asks why,
-            Campus calls with ancient tales,
-            Wisdom finds its way.
-            """
+            logger.info("UniversityPoet will respond with a normal response. Context: %s", context_variables)
+            return _dumps({"content": _THANKS, "context_variables": context_variables})
 
     # SchedulingAssistant handoff (finalisation) (now tool calls)
     def _scheduling_assistant_finalise(self, context_variables: dict) -> str:
@@ -336,7 +432,7 @@ class UniversitySupportBlueprint(BlueprintBase):
         Finalise interaction from Scheduling Assistant.
         """
         logger.debug("Scheduling Assistant finalising interaction.")
-        return json.dumps({"content": self._finalise_response(context_variables), "context_variables": context_variables})
+        return _dumps({"content": _THANKS, "context_variables": context_variables})
 
     # =========================================
     # 4) Framework Integration (execute)
@@ -386,12 +482,13 @@ class UniversitySupportBlueprint(BlueprintBase):
         ]
         context_variables = {}
         active_agent = starting_agent
+        finalised = False  # Set as soon as a finalisation message is appended
         while active_agent:
-            logger.info(f"Calling agent: {active_agent.name}, with context: {context_variables}")
+            logger.info("Calling agent: %s, with context: %s", active_agent.name, context_variables)
             try:
-                logger.debug(f"Running Swarm client with agent: {active_agent.name}")
+                logger.debug("Running Swarm client with agent: %s", active_agent.name)
                 response = self.client.run(agent=active_agent, messages=messages, context_variables=context_variables)
-                logger.debug(f"Received response from agent: {active_agent.name}")
+                logger.debug("Received response from agent: %s", active_agent.name)
             except Exception as e:
                 logger.exception(f"Error during Swarm run with agent {active_agent.name}: {e}")
                 return {
@@ -400,21 +497,22 @@ class UniversitySupportBlueprint(BlueprintBase):
                     "metadata": self.metadata,
                 }
 
-            for message in response.messages:
-                if isinstance(message, dict) and 'content' in message:
-                    content = message['content']
-                    logger.debug(f"Processing message content: {content}")
-
-                    # Append the assistant's message to the conversation
-                    messages.append(message)
+            # Append the assistant's messages to the conversation in one go
+            new_messages = [m for m in response.messages if isinstance(m, dict) and 'content' in m]
+            messages.extend(new_messages)
+            if logger.isEnabledFor(logging.DEBUG):
+                for message in new_messages:
+                    logger.debug("Processing message content: %s", message['content'])
+            if not finalised:
+                finalised = any(isinstance(m['content'], str) and _FINAL_MARKER in m['content'] for m in new_messages)
 
 
             if response.agent:
                 active_agent = response.agent
-                logger.info(f"Handing off to agent: {active_agent.name}")
+                logger.info("Handing off to agent: %s", active_agent.name)
                 if response.context_variables:
                    context_variables = response.context_variables
-            elif any("Thank you for using the University Support System" in msg.get("content", "") for msg in messages):
+            elif finalised:
                 logger.info("Finalisation message detected. Ending interaction.")
                 break
             else:
@@ -445,6 +543,7 @@ class UniversitySupportBlueprint(BlueprintBase):
             logger.critical("TriageAgent not found. Cannot enter interactive mode.")
             return
         logger.info(f"Starting interactive mode with agent: {starting_agent.name}")
+        from swarm.repl import run_demo_loop  # Deferred: only needed for interactive sessions, not blueprint discovery
         try:
             run_demo_loop(starting_agent=starting_agent)
             logger.debug("Exited interactive mode successfully.")
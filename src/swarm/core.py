@@ -52,14 +52,14 @@ class Swarm:
     and environment variable usage.
     """
 
-    def __init__(self, client=None, config_path: Optional[str] = None):
+    def __init__(self, client=None, config_path: Optional[Union[str, os.PathLike]] = None):
         """
         Initialize the Swarm with an optional custom OpenAI client.
         If no client is provided, a default is created.
 
         Args:
             client: Custom OpenAI client instance.
-            config_path (Optional[str]): Path to the configuration file.
+            config_path (Optional[Union[str, os.PathLike]]): Path to the configuration file.
         """
         logger.debug("Initializing Swarm instance.")
         
@@ -79,6 +79,7 @@ class Swarm:
         base_url = llm_config.get("base_url", "https://api.openai.com/v1")
         model = llm_config.get("model", "gpt-4o")
         temperature = llm_config.get("temperature", 0.7)
+        self.temperature = temperature  # Default for agents whose model is not itself an LLM profile name
 
         # Set OpenAI client configurations
         openai.api_key = api_key
@@ -393,7 +394,7 @@ class Swarm:
         create_params = {
             "model": model_override or agent.model,
             "messages": messages,
-            "temperature": self.config.get("llm", {}).get(agent.model, {}).get("temperature", 0.7),
+            "temperature": self.config.get("llm", {}).get(agent.model, {}).get("temperature", self.temperature),
             "stream": stream,
         }
 
@@ -18,6 +18,9 @@ from .utils.logger import setup_logger
 # Initialize logger for this module
 logger = setup_logger(__name__)
 
+# Matches ${VAR_NAME} placeholders in configuration strings
+PLACEHOLDER_PATTERN = re.compile(r'\$\{(\w+)\}')
+
 def resolve_placeholders(obj: Any) -> Any:
     """
     Recursively resolve placeholders in the given object.
@@ -38,8 +41,10 @@ def resolve_placeholders(obj: Any) -> Any:
     elif isinstance(obj, list):
         return [resolve_placeholders(item) for item in obj]
     elif isinstance(obj, str):
-        pattern = re.compile(r'\$\{(\w+)\}')
-        matches = pattern.findall(obj)
+        # Cheap substring check lets strings without placeholders skip the regex entirely
+        if "${" not in obj:
+            return obj
+        matches = PLACEHOLDER_PATTERN.findall(obj)
         for var in matches:
             env_value = os.getenv(var)
             if env_value is None:
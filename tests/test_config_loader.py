@@ -29,6 +29,11 @@ def test_resolve_placeholders_simple(mock_env):
     """Test resolving placeholders in strings."""
     assert resolve_placeholders("${TEST_VAR}") == "test_value"
 
+def test_resolve_placeholders_no_placeholder():
+    """Test strings without placeholders are returned unchanged."""
+    assert resolve_placeholders("$TEST_VAR plain {value}") == "$TEST_VAR plain {value}"
+    assert resolve_placeholders({"args": ["-y", "server"]}) == {"args": ["-y", "server"]}
+
 def test_resolve_placeholders_missing():
     """Test missing environment variable raises ValueError."""
     with pytest.raises(ValueError, match="Environment variable 'MISSING_VAR' is not set but is required."):
@@ -3,224 +3,185 @@
 import pytest
 import os
 import json
-from unittest.mock import patch, Mock
+import re
+from types import SimpleNamespace
+from unittest.mock import patch
 from swarm.core import Swarm
-from swarm.types import Agent, Tool, Result
-import openai  # Import openai to fix NameError
-
-# Helper function to create a mock response
+from swarm.types import Agent
+
+# Mock chat completion response as plain namespaces, built once and shared since tests only read it
+_MOCK_JSON = '{"role": "assistant", "content": "This is a mocked response."}'
+_MOCK_MESSAGE = SimpleNamespace(
+    role="assistant",
+    content="This is a mocked response.",
+    tool_calls=None,
+    model_dump_json=lambda: _MOCK_JSON
+)
+_MOCK_RESPONSE = SimpleNamespace(choices=[SimpleNamespace(message=_MOCK_MESSAGE)])
+
+# Helper function returning the mock response
 def mock_chat_completion_create(**kwargs):
-    mock_response = Mock()
-    mock_response.choices = [
-        Mock(
-            message=Mock(
-                role="assistant",
-                content="This is a mocked response.",
-                model_dump_json=lambda: json.dumps({
-                    "role": "assistant",
-                    "content": "This is a mocked response."
-                })
-            )
-        )
-    ]
-    return mock_response
-
-# Fixture to create a sample configuration
-@pytest.fixture
-def sample_config(tmp_path):
-    config = {
-        "llm": {
-            "default": {
-                "provider": "openai",
-                "model": "gpt-4o",
-                "base_url": "https://api.openai.com/v1",
-                "api_key": "${OPENAI_API_KEY}",
-                "temperature": 0.7
-            },
-            "openai": {
-                "provider": "openai",
-                "model": "gpt-4o",
-                "base_url": "https://api.openai.com/v1",
-                "api_key": "${OPENAI_API_KEY}",
-                "temperature": 0.7
-            },
-            "grok": {
-                "provider": "openai",
-                "model": "grok-2-1212",
-                "base_url": "https://api.x.ai/v1",
-                "api_key": "${XAI_API_KEY}",
-                "temperature": 0.0
-            },
-            "ollama": {
-                "provider": "openai",
-                "model": "llama3.2:latest",
-                "base_url": "http://localhost:11434/",
-                "api_key": "",
-                "temperature": 0.0
-            }
-        },
-        "mcpServers": {
-            "brave-search": {
-                "command": "npx",
-                "args": ["-y", "@modelcontextprotocol/server-brave-search"],
-                "env": {
-                    "BRAVE_API_KEY": "${BRAVE_API_KEY}"
+    return _MOCK_RESPONSE
+
+# Patch OpenAI chat completions once for the whole module; tests reset the shared mock as needed
+@pytest.fixture(scope="module", autouse=True)
+def _patch_openai():
+    with patch('openai.ChatCompletion.create', side_effect=mock_chat_completion_create) as mock_create:
+        yield mock_create
+
+# Sample configuration shared by the config fixtures, stored pre-serialised so it is never re-encoded
+_SAMPLE_CONFIG_BYTES = (
+    b'{"llm":{'
+    b'"default":{"provider":"openai","model":"gpt-4o","base_url":"https://api.openai.com/v1","api_key":"${OPENAI_API_KEY}","temperature":0.7},'
+    b'"openai":{"provider":"openai","model":"gpt-4o","base_url":"https://api.openai.com/v1","api_key":"${OPENAI_API_KEY}","temperature":0.7},'
+    b'"grok":{"provider":"openai","model":"grok-2-1212","base_url":"https://api.x.ai/v1","api_key":"${XAI_API_KEY}","temperature":0.0},'
+    b'"ollama":{"provider":"openai","model":"llama3.2:latest","base_url":"http://localhost:11434/","api_key":"","temperature":0.0}'
+    b'},"mcpServers":{'
+    b'"brave-search":{"command":"npx","args":["-y","@modelcontextprotocol/server-brave-search"],"env":{"BRAVE_API_KEY":"${BRAVE_API_KEY}"}},'
+    b'"sqlite":{"command":"npx","args":["-y","mcp-server-sqlite-npx","${SQLITE_DB_PATH}"],"env":{"npm_config_registry":"https://registry.npmjs.org","SQLITE_DB_PATH":"${SQLITE_DB_PATH}"}},'
+    b'"sqlite-uvx":{"command":"uvx","args":["mcp-server-sqlite","--db-path","/tmp/test.db"]},'
+    b'"everything":{"command":"npx","args":["-y","@modelcontextprotocol/server-everything"],"env":{}},'
+    b'"filesystem":{"command":"npx","args":["-y","@modelcontextprotocol/server-filesystem","$ALLOWED_PATHS"],"env":{"ALLOWED_PATHS":"${ALLOWED_PATHS}"}}'
+    b'}}'
+)
+
+# Fixture to create a sample configuration, written once per session
+@pytest.fixture(scope="session")
+def sample_config(tmp_path_factory):
+    config_file = tmp_path_factory.mktemp("cfg") / "swarm_settings.json"
+    config_file.write_bytes(_SAMPLE_CONFIG_BYTES)
+
+    return config_file
+
+# Environment variables required by the sample configuration
+_ENV_VARS = {
+    "LLM": "grok",
+    "XAI_API_KEY": "test_grok_api_key",
+    "OPENAI_API_KEY": "test_openai_api_key",
+    "BRAVE_API_KEY": "test_brave_api_key",
+    "SQLITE_DB_PATH": "/tmp/test.db",
+    "ALLOWED_PATHS": "/allowed/path",
+}
+
+# Fixture to set environment variables once per module with a bulk update, restoring them afterwards
+# so they don't leak into later test modules; tests layer their own monkeypatch on top
+@pytest.fixture(scope="module")
+def set_env_vars():
+    saved = {key: os.environ.get(key) for key in _ENV_VARS}
+    os.environ.update(_ENV_VARS)
+    yield
+    for key, value in saved.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+
+# Test that Swarm applies the selected LLM profile and passes the agent's settings to OpenAI
+@pytest.mark.parametrize("llm,base,key,model,temp", [
+    ("grok", "https://api.x.ai/v1", "test_grok_api_key", "grok-2-1212", 0.0),
+    ("openai", "https://api.openai.com/v1", "test_openai_api_key", "gpt-4o", 0.7),
+])
+def test_llm_config_usage(sample_config, set_env_vars, _patch_openai, monkeypatch, llm, base, key, model, temp):
+    """
+    Test that core.py uses the selected LLM profile from the JSON config file and environment.
+    """
+    import openai  # Only needed to inspect the client settings applied by Swarm
+
+    monkeypatch.setenv("LLM", llm)
+    mock_create = _patch_openai
+    mock_create.reset_mock()  # The patch is shared across the module, so clear earlier calls
+    swarm = Swarm(config_path=sample_config)
+
+    # Check that the base_url and api_key were set from the selected profile
+    assert openai.api_base == base, "API base URL does not match config."
+    assert openai.api_key == key, "API key does not match config."
+
+    agent = Agent(
+        name="TestAgent",
+        model=model,
+        instructions="You are a test agent.",
+        functions=[],
+        tool_choice=None,
+        parallel_tool_calls=True,
+        mcp_servers=[],
+        env_vars={}
+    )
+
+    # Run a simple chat completion
+    swarm.run(agent=agent, messages=[], stream=False)
+
+    # Verify that the OpenAI client was called with correct parameters
+    mock_create.assert_called_once()
+    last_kwargs = mock_create.call_args.kwargs
+    assert last_kwargs["model"] == model, "Model does not match config."
+    assert last_kwargs["temperature"] == temp, "Temperature does not match config."
+
+# Invalid configurations (missing API key): variant name -> (config, selected LLM, missing env var)
+_INVALID_CONFIGS = {
+    "missing_xai_api_key": (
+        {
+            "llm": {
+                "grok": {
+                    "provider": "openai",
+                    "model": "grok-2-1212",
+                    "base_url": "https://api.x.ai/v1",
+                    "api_key": "${XAI_API_KEY}",
+                    "temperature": 0.0
                 }
             },
-            "sqlite": {
-                "command": "npx",
-                "args": ["-y", "mcp-server-sqlite-npx", "${SQLITE_DB_PATH}"],
-                "env": {
-                    "npm_config_registry": "https://registry.npmjs.org",
-                    "SQLITE_DB_PATH": "${SQLITE_DB_PATH}"
+            "mcpServers": {}
+        },
+        "grok",
+        "XAI_API_KEY",
+    ),
+    "missing_openai_api_key": (
+        {
+            "llm": {
+                "default": {
+                    "provider": "openai",
+                    "model": "gpt-4o",
+                    "base_url": "https://api.openai.com/v1",
+                    "api_key": "${OPENAI_API_KEY}",
+                    "temperature": 0.7
                 }
             },
-            "sqlite-uvx": {
-                "command": "uvx",
-                "args": ["mcp-server-sqlite", "--db-path", "/tmp/test.db"]
-            },
-            "everything": {
-                "command": "npx",
-                "args": ["-y", "@modelcontextprotocol/server-everything"],
-                "env": {}
-            },
-            "filesystem": {
-                "command": "npx",
-                "args": [
-                    "-y",
-                    "@modelcontextprotocol/server-filesystem",
-                    "$ALLOWED_PATHS"
-                ],
-                "env": {
-                    "ALLOWED_PATHS": "${ALLOWED_PATHS}"
-                }
-            }
-        }
-    }
-
-    config_file = tmp_path / "swarm_settings.json"
-    with open(config_file, "w") as f:
-        json.dump(config, f)
-
-    return str(config_file)
-
-# Fixture to set environment variables
-@pytest.fixture
-def set_env_vars(monkeypatch):
-    env_vars = {
-        "LLM": "grok",
-        "XAI_API_KEY": "test_grok_api_key",
-        "OPENAI_API_KEY": "test_openai_api_key",
-        "BRAVE_API_KEY": "test_brave_api_key",
-        "SQLITE_DB_PATH": "/tmp/test.db",
-        "ALLOWED_PATHS": "/allowed/path",
-    }
-    for key, value in env_vars.items():
-        monkeypatch.setenv(key, value)
-
-# # Test to validate API keys
-# def test_validate_api_keys(sample_config, set_env_vars):
-#     """
-#     Test that validate_api_keys correctly sets the API key from environment variables.
-#     """
-#     with patch('openai.ChatCompletion.create', side_effect=mock_chat_completion_create) as mock_create:
-#         swarm = Swarm(config_path=sample_config)
-
-#         # Initialize with an agent that uses 'grok' LLM
-#         agent = Agent(
-#             name="TestAgent",
-#             model="grok-2-1212",
-#             instructions="You are a test agent.",
-#             functions=[],
-#             tool_choice=None,
-#             parallel_tool_calls=True,
-#             mcp_servers=[],
-#             env_vars={}
-#         )
-
-#         # Run a simple chat completion
-#         response = swarm.run(agent=agent, messages=[], stream=False)
-
-#         # Verify that the OpenAI client was called with correct parameters
-#         mock_create.assert_called_once()
-#         args, kwargs = mock_create.call_args
-
-#         # Check that the base_url was set correctly
-#         assert openai.api_base == "https://api.x.ai/v1", "API base URL does not match config."
-
-#         # Check that the api_key was set correctly
-#         assert openai.api_key == "test_grok_api_key", "API key does not match config."
-
-# # Test to ensure that core.py uses LLM config from JSON
-# def test_llm_config_usage(sample_config, set_env_vars):
-#     """
-#     Test that core.py correctly uses the LLM configuration from the JSON config file.
-#     """
-#     with patch('openai.ChatCompletion.create', side_effect=mock_chat_completion_create) as mock_create:
-#         swarm = Swarm(config_path=sample_config)
-
-#         # Verify that the OpenAI client is configured correctly
-#         selected_llm = os.getenv("LLM")
-#         llm_config = {
-#             "provider": "openai",
-#             "model": "grok-2-1212",
-#             "base_url": "https://api.x.ai/v1",
-#             "api_key": "test_grok_api_key",
-#             "temperature": 0.0
-#         }
-
-#         assert openai.api_base == llm_config["base_url"], "API base URL does not match config."
-#         assert openai.api_key == llm_config["api_key"], "API key does not match config."
-
-#         # Initialize with an agent that uses 'grok' LLM
-#         agent = Agent(
-#             name="TestAgent",
-#             model="grok-2-1212",
-#             instructions="You are a test agent.",
-#             functions=[],
-#             tool_choice=None,
-#             parallel_tool_calls=True,
-#             mcp_servers=[],
-#             env_vars={}
-#         )
-
-#         # Run a simple chat completion
-#         response = swarm.run(agent=agent, messages=[], stream=False)
-
-#         # Verify that the OpenAI client was called with correct parameters
-#         mock_create.assert_called_once()
-#         args, kwargs = mock_create.call_args
-
-#         # Check the parameters passed to OpenAI
-#         assert kwargs["model"] == "grok-2-1212", "Model does not match config."
-#         assert kwargs["temperature"] == 0.0, "Temperature does not match config."
+            "mcpServers": {}
+        },
+        "default",
+        "OPENAI_API_KEY",
+    ),
+}
+
+# Expected error for each invalid configuration, compiled once
+_MISSING_KEY_RES = {
+    name: re.compile(re.escape(
+        f"Environment variable '{missing_var}' required for API key in LLM profile '{llm}' is not set or empty."
+    ))
+    for name, (_, llm, missing_var) in _INVALID_CONFIGS.items()
+}
+
+# Fixture writing every invalid configuration variant once per session
+@pytest.fixture(scope="session")
+def invalid_configs(tmp_path_factory):
+    config_dir = tmp_path_factory.mktemp("invalid_cfg")
+    paths = {}
+    for name, (config, _, _) in _INVALID_CONFIGS.items():
+        config_file = config_dir / f"{name}.json"
+        config_file.write_text(json.dumps(config, separators=(",", ":")))
+        paths[name] = config_file
+    return paths
 
 # Test for invalid configuration (missing API key)
-def test_load_configuration_invalid(tmp_path, monkeypatch):
+@pytest.mark.parametrize("variant", list(_INVALID_CONFIGS))
+def test_load_configuration_invalid(invalid_configs, monkeypatch, variant):
     """
     Test that loading an invalid configuration (missing API key) raises a ValueError.
     """
-    # Create an invalid config where 'grok' API key is missing
-    config = {
-        "llm": {
-            "grok": {
-                "provider": "openai",
-                "model": "grok-2-1212",
-                "base_url": "https://api.x.ai/v1",
-                "api_key": "${XAI_API_KEY}",
-                "temperature": 0.0
-            }
-        },
-        "mcpServers": {}
-    }
-
-    config_file = tmp_path / "invalid_swarm_settings.json"
-    with open(config_file, "w") as f:
-        json.dump(config, f)
+    _, llm, missing_var = _INVALID_CONFIGS[variant]
 
-    # Set LLM to 'grok' but do not set XAI_API_KEY
-    monkeypatch.setenv("LLM", "grok")
-    monkeypatch.delenv("XAI_API_KEY", raising=False)
+    # Select the LLM profile but do not set its API key variable
+    monkeypatch.setenv("LLM", llm)
+    monkeypatch.delenv(missing_var, raising=False)
 
-    with pytest.raises(ValueError, match="Environment variable 'XAI_API_KEY' required for API key in LLM profile 'grok' is not set or empty."):
-        swarm = Swarm(config_path=str(config_file))
+    with pytest.raises(ValueError, match=_MISSING_KEY_RES[variant]):
+        Swarm(config_path=invalid_configs[variant])